@@ -1,8 +1,14 @@
 import time
 import random
 import concurrent.futures
-from tools.github_tool import search_repositories
-from tools.weather_tool import get_weather
+from tools.github_tool import search_repositories, search_repositories_batch
+from tools.weather_tool import get_weather, get_weather_batch
+
+# Tools whose steps can be merged into a single batched call
+BATCH_TOOLS = {
+    "github_search": search_repositories_batch,
+    "weather_api": get_weather_batch,
+}
 
 def retry_with_backoff(func, *args, max_retries=3, base_delay=1, **kwargs):
     """Retry function with exponential backoff"""
@@ -31,12 +37,7 @@ def execute_single_step(step):
         else:
             output = {"info": f"No tool needed for: {step['action']}"}
         
-        return {
-            "step_id": step["step_id"],
-            "action": step["action"],
-            "output": output,
-            "status": "success"
-        }
+        return success_result(step, output)
     except Exception as e:
         return {
             "step_id": step["step_id"],
@@ -45,29 +46,76 @@ def execute_single_step(step):
             "status": "failed"
         }
 
+def success_result(step, output):
+    return {
+        "step_id": step["step_id"],
+        "action": step["action"],
+        "output": output,
+        "status": "success"
+    }
+
+def collapse_plan(plan):
+    """Merge same-tool steps into batches; each job is a list of steps"""
+    jobs = []
+    batches = {}
+    for step in plan:
+        tool = step.get("tool")
+        if tool in BATCH_TOOLS and isinstance(step.get("input"), (str, int)):
+            if tool not in batches:
+                batches[tool] = []
+                jobs.append(batches[tool])
+            batches[tool].append(step)
+        else:
+            jobs.append([step])
+    return jobs
+
+def execute_job(steps):
+    """
+    Execute a job, using one batched call when it holds several steps.
+    Returns (results, leftover steps the batch could not answer).
+    """
+    if len(steps) == 1:
+        return [execute_single_step(steps[0])], []
+
+    tool = steps[0]["tool"]
+    print(f"Batching {len(steps)} {tool} steps into one call...")
+    try:
+        outputs = BATCH_TOOLS[tool]([step["input"] for step in steps])
+    except Exception as e:
+        print(f"Batched {tool} call failed: {e}. Falling back to single steps...")
+        outputs = {}
+
+    # Split results back out per step_id
+    results = [success_result(step, outputs[step["input"]]) for step in steps if step["input"] in outputs]
+    leftovers = [step for step in steps if step["input"] not in outputs]
+    return results, leftovers
+
 def can_execute_parallel(plan):
     """Check if steps can be executed in parallel (no dependencies)"""
     return len(plan) > 1
 
 def execute_plan(plan):
     results = []
+    jobs = collapse_plan(plan)
     
     if can_execute_parallel(plan):
-        print(f"Executing {len(plan)} steps in parallel...")
+        print(f"Executing {len(plan)} steps as {len(jobs)} jobs in parallel...")
         with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(plan), 4)) as executor:
-            # Submit all steps for parallel execution
-            future_to_step = {executor.submit(execute_single_step, step): step for step in plan}
+            # Submit all jobs for parallel execution
+            pending = {executor.submit(execute_job, job) for job in jobs}
             
-            # Collect results as they complete
-            for future in concurrent.futures.as_completed(future_to_step):
-                result = future.result()
-                results.append(result)
+            # Collect results as they complete; leftover steps run as single jobs in the same pool
+            while pending:
+                done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    job_results, leftovers = future.result()
+                    results.extend(job_results)
+                    pending |= {executor.submit(execute_job, [step]) for step in leftovers}
     else:
         # Sequential execution for single steps or dependent steps
         print("Executing steps sequentially...")
         for step in plan:
-            result = execute_single_step(step)
-            results.append(result)
+            results.extend(execute_job([step])[0])
     
     # Sort results by step_id to maintain order
     results.sort(key=lambda x: x["step_id"])
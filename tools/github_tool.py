@@ -1,22 +1,85 @@
 import os
+from typing import NamedTuple, Optional
 import requests
 from utils.cache import cached_function
+from utils.fast_json import loads
 
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
+GRAPHQL_URL = "https://api.github.com/graphql"
+MAX_PER_PAGE = 100  # GitHub search page size limit
 
-@cached_function(ttl_seconds=600)  # Cache for 10 minutes
-def search_repositories(query, limit=3):
-    url = f"https://api.github.com/search/repositories?q={query}&sort=stars"
+class RepoRecord(NamedTuple):
+    name: str
+    stars: int
+    description: Optional[str]
+
+def _build_search_query(count, limit):
+    """Build a GraphQL document with one aliased search per query"""
+    variables = ", ".join(f"$q{i}: String!" for i in range(count))
+    searches = " ".join(
+        f"q{i}: search(query: $q{i}, type: REPOSITORY, first: {limit}) "
+        "{ nodes { ... on Repository { nameWithOwner stargazerCount description } } }"
+        for i in range(count)
+    )
+    return f"query({variables}) {{ {searches} }}"
+
+def _graphql_search(queries, limit):
+    """Run repository searches in one GraphQL request, fetching only the fields we report"""
+    payload = {
+        "query": _build_search_query(len(queries), min(limit, MAX_PER_PAGE)),
+        "variables": {f"q{i}": f"{query} sort:stars" for i, query in enumerate(queries)},
+    }
     headers = {"Authorization": f"token {GITHUB_TOKEN}"}
-    resp = requests.get(url, headers=headers)
+    resp = requests.post(GRAPHQL_URL, json=payload, headers=headers)
     resp.raise_for_status()
-    data = resp.json()
-
-    results = []
-    for repo in data["items"][:limit]:
-        results.append({
-            "name": repo["full_name"],
-            "stars": repo["stargazers_count"],
-            "description": repo["description"]
-        })
+    data = loads(resp.content)
+
+    results = {}
+    for i, query in enumerate(queries):
+        result = (data.get("data") or {}).get(f"q{i}")
+        if result is not None:
+            results[query] = tuple(
+                RepoRecord(node["nameWithOwner"], node["stargazerCount"], node["description"])
+                for node in result["nodes"] if node
+            )
+    if not results and data.get("errors"):
+        raise ValueError(f"GitHub search failed: {data['errors']}")
     return results
+
+@cached_function(ttl_seconds=600)  # Cache for 10 minutes
+def _fetch_repositories(query, limit):
+    """Fetch only `limit` repos and keep them as compact tuples in the cache"""
+    results = _graphql_search([query], limit)
+    if query not in results:
+        raise ValueError(f"GitHub search returned no results for: {query}")
+    return results[query]
+
+def search_repositories(query, limit=3):
+    return [record._asdict() for record in _fetch_repositories(query, limit)]
+
+def search_repositories_batch(queries, limit=3):
+    """
+    Run several repository searches in one GraphQL round trip.
+    Returns {query: repos} for the queries that succeeded.
+    """
+    records = {}
+    pending = []
+    for query in dict.fromkeys(queries):
+        cached_records = _fetch_repositories.cache_get(query, limit)
+        if cached_records is not None:
+            records[query] = cached_records
+        else:
+            pending.append(query)
+
+    if pending:
+        try:
+            fetched = _graphql_search(pending, limit)
+        except (requests.RequestException, ValueError) as e:
+            print(f"GitHub batch search failed: {e}")
+            fetched = {}
+
+        for query, repos in fetched.items():
+            _fetch_repositories.cache_set(repos, query, limit)
+            records[query] = repos
+
+    return {query: [record._asdict() for record in repos] for query, repos in records.items()}
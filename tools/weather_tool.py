@@ -1,21 +1,98 @@
+import json
 import os
+import threading
+from typing import NamedTuple
 import requests
 from utils.cache import cached_function
+from utils.fast_json import loads
 
 API_KEY = os.getenv("OPENWEATHER_API_KEY")
+WEATHER_URL = "https://api.openweathermap.org/data/2.5/weather"
+GROUP_URL = "https://api.openweathermap.org/data/2.5/group"
+MAX_GROUP_IDS = 20  # OpenWeather group endpoint limit
+CITY_IDS_FILE = "city_ids.json"
+
+class WeatherRecord(NamedTuple):
+    city: str
+    temp_c: float
+    condition: str
+
+def _load_city_ids(filename=CITY_IDS_FILE):
+    """Load city name -> OpenWeather city ID mappings learned on earlier runs"""
+    try:
+        with open(filename) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+# The group endpoint only takes city IDs, so remember the ID of every city we look up
+_city_ids = _load_city_ids()
+_city_ids_lock = threading.Lock()
+
+def _remember_city_id(city, city_id, filename=CITY_IDS_FILE):
+    with _city_ids_lock:
+        if _city_ids.get(city) == city_id:
+            return
+        _city_ids[city] = city_id
+        try:
+            with open(filename, 'w') as f:
+                json.dump(_city_ids, f, indent=2)
+        except OSError as e:
+            print(f"Could not save city IDs: {e}")
+
+def _to_record(city, data):
+    return WeatherRecord(city, data["main"]["temp"], data["weather"][0]["description"])
 
 @cached_function(ttl_seconds=300)  # Cache for 5 minutes
-def get_weather(city):
-    url = (
-        f"https://api.openweathermap.org/data/2.5/weather"
-        f"?q={city}&appid={API_KEY}&units=metric"
-    )
-    resp = requests.get(url)
+def _fetch_weather(city):
+    """Fetch current weather and keep only the fields we report"""
+    params = {"q": city, "appid": API_KEY, "units": "metric"}
+    resp = requests.get(WEATHER_URL, params=params)
+    resp.raise_for_status()
+    data = loads(resp.content)
+
+    _remember_city_id(city, data["id"])
+    return _to_record(city, data)
+
+def _fetch_weather_group(city_ids):
+    """Fetch up to MAX_GROUP_IDS cities by ID in a single request"""
+    params = {"id": ",".join(str(c) for c in city_ids), "appid": API_KEY, "units": "metric"}
+    resp = requests.get(GROUP_URL, params=params)
     resp.raise_for_status()
-    data = resp.json()
+    data = loads(resp.content)
+
+    return {item["id"]: item for item in data["list"]}
+
+def get_weather(city):
+    return _fetch_weather(city)._asdict()
+
+def get_weather_batch(cities):
+    """
+    Fetch weather for many cities in as few round trips as possible.
+    Cities with a known OpenWeather ID go through the group endpoint,
+    20 per request. Returns {city: weather} for the cities it answered;
+    the rest are left to get_weather, which learns their IDs for next time.
+    """
+    records = {}
+    pending = []
+    for city in dict.fromkeys(cities):
+        cached_record = _fetch_weather.cache_get(city)
+        if cached_record is not None:
+            records[city] = cached_record
+        elif city in _city_ids:
+            pending.append((city, _city_ids[city]))
+
+    for i in range(0, len(pending), MAX_GROUP_IDS):
+        chunk = pending[i:i + MAX_GROUP_IDS]
+        try:
+            fetched = _fetch_weather_group(dict.fromkeys(city_id for _, city_id in chunk))
+        except requests.RequestException as e:
+            print(f"Weather group request failed: {e}")
+            continue
+        for city, city_id in chunk:
+            if city_id in fetched:
+                record = _to_record(city, fetched[city_id])
+                _fetch_weather.cache_set(record, city)
+                records[city] = record
 
-    return {
-        "city": city,
-        "temp_c": data["main"]["temp"],
-        "condition": data["weather"][0]["description"]
-    }
+    return {city: record._asdict() for city, record in records.items()}
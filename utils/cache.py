@@ -1,4 +1,5 @@
 import hashlib
+import inspect
 import json
 import time
 from typing import Any, Optional, Dict
@@ -24,7 +25,7 @@ class SimpleCache:
         
         if key in self.cache:
             entry = self.cache[key]
-            if time.time() - entry['timestamp'] < self.ttl_seconds:
+            if time.time() - entry['timestamp'] < entry.get('ttl', self.ttl_seconds):
                 print(f"Cache hit for {func_name}")
                 return entry['value']
             else:
@@ -33,12 +34,14 @@ class SimpleCache:
         
         return None
     
-    def set(self, func_name: str, args: tuple, kwargs: dict, value: Any) -> None:
-        """Set value in cache"""
+    def set(self, func_name: str, args: tuple, kwargs: dict, value: Any,
+            ttl_seconds: Optional[int] = None) -> None:
+        """Set value in cache, optionally with its own TTL"""
         key = self._generate_key(func_name, args, kwargs)
         self.cache[key] = {
             'value': value,
-            'timestamp': time.time()
+            'timestamp': time.time(),
+            'ttl': ttl_seconds if ttl_seconds is not None else self.ttl_seconds
         }
         print(f"Cached result for {func_name}")
     
@@ -57,16 +60,34 @@ cache = SimpleCache(ttl_seconds=300)  # 5 minutes
 def cached_function(ttl_seconds: int = 300):
     """Decorator to cache function results"""
     def decorator(func):
+        signature = inspect.signature(func)
+
+        def call_args(args, kwargs):
+            # Normalize positional/keyword calls so they share one cache entry
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return bound.args, bound.kwargs
+
+        def cache_get(*args, **kwargs):
+            """Get the cached result for these arguments without calling func"""
+            return cache.get(func.__name__, *call_args(args, kwargs))
+
+        def cache_set(value, *args, **kwargs):
+            """Store a result for these arguments as if func had returned it"""
+            cache.set(func.__name__, *call_args(args, kwargs), value, ttl_seconds)
+
         def wrapper(*args, **kwargs):
             # Try to get from cache first
-            cached_result = cache.get(func.__name__, args, kwargs)
+            cached_result = cache_get(*args, **kwargs)
             if cached_result is not None:
                 return cached_result
             
             # Execute function and cache result
             result = func(*args, **kwargs)
-            cache.set(func.__name__, args, kwargs, result)
+            cache_set(result, *args, **kwargs)
             return result
         
+        wrapper.cache_get = cache_get
+        wrapper.cache_set = cache_set
         return wrapper
     return decorator
@@ -0,0 +1,12 @@
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib parser
+    orjson = None
+
+def loads(raw: bytes):
+    """Parse a JSON payload, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)